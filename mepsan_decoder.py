@@ -1,5 +1,14 @@
-import re
+import functools
 import json
+import operator
+import re
+import struct
+
+# orjson is optional; it encodes the large all_frames payload much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 UNIT_PRICE = 2.18  # Confirmed Special 91 price
 
@@ -9,45 +18,151 @@ MONEY_DIVISOR = 1000    # Convert Money_BCD to SAR
 CONSTANT_MULTIPLIER = 0.218  # Money_BCD = Liters_BCD × 0.218
 
 
+# Everything up to and including the first "DATA:" marker on a line
+_DATA_PREFIX_RE = re.compile(r"^.*?DATA:", re.MULTILINE)
+
+
 def clean_dump(raw):
-    lines = raw.strip().splitlines()
-    hexbytes = []
+    """Convert a text dump into raw bytes.
 
-    for line in lines:
-        if "DATA:" in line:
-            line = line.split("DATA:")[1].strip()
-        hexbytes.extend(line.split())
+    Lines may carry a "... DATA:" prefix; only the hex bytes after it are kept.
+    The hex text is parsed in one pass by bytes.fromhex (which skips spaces and
+    newlines), so no per-byte Python work is done.
+    """
+    return bytes.fromhex(_DATA_PREFIX_RE.sub("", raw))
 
-    return [int(x, 16) for x in hexbytes]
 
+FRAME_END = b"\x03\xFA"
 
-def extract_frames(byte_stream):
-    frames = []
-    current = []
+# Signature bytes checked by the is_* predicates (starting at byte 2 unless noted)
+_PRICE_TABLE_SIG = b"\x01\x01\x05\x03"
+_FUELING_SIG = b"\x02\x08\x00\x00"
+_DATA_ITEM_SIG = b"\x01\x01"
+_CONFIG_SIG = b"\x03\x04\x00\x21\x80"
+_MULTI_DATA_SIG = b"\x02\x04"
+_SPECIAL_DATA_SIG = b"\x05\x0C\x00\x21\x80"
 
-    i = 0
-    while i < len(byte_stream):
-        # Skip USC+ wrapper blocks: 50 XX FA or 51 XX FA
-        if i + 2 < len(byte_stream) and byte_stream[i+2] == 0xFA and byte_stream[i] in (0x50, 0x51):
-            i += 3
-            continue
+# Bytes 2-9 of a single price frame, 01 01 XX 03 04 00 21 80, read as one
+# big-endian integer; the mask ignores the price type in byte 4
+_read_u64 = struct.Struct(">Q").unpack_from
+_SINGLE_PRICE_MASK = 0xFFFF00FFFFFFFFFF
+_SINGLE_PRICE_SIG = 0x0101000304002180
+
+# Bytes allowed in the body of a heartbeat frame
+_HEARTBEAT_BYTES = b"\x50\x51\x20\x70\xFA"
 
-        current.append(byte_stream[i])
 
-        # end-of-frame
-        if len(current) >= 2 and current[-2:] == [0x03, 0xFA]:
-            frames.append(current.copy())
-            current = []
+def _strip_wrappers(buf, out, final=True):
+    """Append buf to the bytearray out with USC+ wrapper blocks (50 XX FA or
+    51 XX FA) removed.
 
-        i += 1
+    A wrapper can only start two bytes before an FA, so instead of testing
+    every position we jump from one FA to the next with bytes.find and copy
+    the runs in between as whole slices.
 
+    Returns the number of bytes consumed. With final=False a 50 or 51 in the
+    last two bytes is not consumed, since it may still start a wrapper once
+    more data arrives.
+    """
+    i = 0
+    while True:
+        j = buf.find(0xFA, i + 2)
+        if j == -1:
+            break
+        k = j - 2
+        if buf[k] == 0x50 or buf[k] == 0x51:
+            out += buf[i:k]
+            i = j + 1
+        else:
+            # Not a wrapper; the next candidate start is k + 1
+            out += buf[i:k + 1]
+            i = k + 1
+    stop = len(buf)
+    if not final:
+        for k in range(max(i, stop - 2), stop):
+            if buf[k] == 0x50 or buf[k] == 0x51:
+                stop = k
+                break
+    out += buf[i:stop]
+    return stop
+
+
+def _split_frames(payload, search_from=0):
+    """Cut payload after every 03 FA marker.
+
+    Returns (frames, consumed); bytes after the last marker are not consumed.
+    search_from lets callers skip a prefix already known to hold no marker.
+    """
+    # Markers never overlap, so count() gives the exact number of frames
+    frames = [None] * payload.count(FRAME_END, search_from)
+    start = 0
+    end = search_from
+    for k in range(len(frames)):
+        end = payload.find(FRAME_END, end) + 2
+        frames[k] = bytes(payload[start:end])  # no copy when payload is bytes
+        start = end
+    return frames, start
+
+
+def extract_frames(byte_stream):
+    """Split a byte stream (bytes, bytearray or list of ints) into frames.
+
+    Wrapper blocks are stripped first, then the payload is cut after every
+    03 FA end-of-frame marker. Trailing bytes without a marker are dropped.
+    """
+    payload = bytearray()
+    _strip_wrappers(bytes(byte_stream), payload)
+    # Slices of an immutable payload are the frames themselves
+    frames, _ = _split_frames(bytes(payload))
     return frames
+
+
+class FrameScanner:
+    """Incremental extract_frames for a live byte stream.
+
+    feed() only scans the newly received bytes. The partial frame at the end
+    of the stream, and up to two bytes that may still start a wrapper block,
+    are kept for the next call.
+    """
+
+    # Prevent buffer overflow - keep last 500 bytes if no frame end arrives
+    MAX_PENDING = 1000
+    KEEP_PENDING = 500
+
+    def __init__(self):
+        self._raw = b""            # up to two bytes not yet checked for wrapper blocks
+        self._frame = bytearray()  # unwrapped bytes of the frame in progress
+
+    def feed(self, chunk):
+        """Add chunk to the stream and return the frames it completed."""
+        buf = self._raw + chunk if self._raw else chunk
+        # No marker is pending, but one may straddle the old and new bytes
+        search_from = max(len(self._frame) - 1, 0)
+
+        # Unwrap straight into the reused frame buffer
+        consumed = _strip_wrappers(buf, self._frame, final=False)
+        self._raw = buf[consumed:]
+
+        frames, consumed = _split_frames(self._frame, search_from)
+        del self._frame[:consumed]
+
+        if len(self._frame) > self.MAX_PENDING:
+            del self._frame[:-self.KEEP_PENDING]
+        return frames
+
+
 def is_heartbeat(frame):
     """Heartbeat frames are small, contain only repeating 50/51 + 20/70 sequences."""
     if len(frame) < 6:
         return True
-    body = frame[:-2]
-    return all(x in (0x50, 0x51, 0x20, 0x70, 0xFA) for x in body)
+    return _is_heartbeat_frame(bytes(frame))
+
+
+# Heartbeats arrive as long runs of identical frames, so most calls are cache hits
+@functools.lru_cache(maxsize=256)
+def _is_heartbeat_frame(frame):
+    # Deleting every heartbeat byte from the body leaves nothing for a heartbeat
+    return not frame[:-2].translate(None, _HEARTBEAT_BYTES)
 
 
 def is_price_table(frame):
@@ -56,8 +171,7 @@ def is_price_table(frame):
 
     # pattern:
     # PP GG 01 01 05 03 04 p1_hi p1_lo p2_hi p2_lo p3_hi p3_lo p4_hi p4_lo CRC 03 FA
-    return (frame[2:6] == [0x01, 0x01, 0x05, 0x03] and
-            frame[-2:] == [0x03, 0xFA])
+    return frame[2:6] == _PRICE_TABLE_SIG and frame[-2:] == FRAME_END
 
 
 def decode_price_table(frame):
@@ -82,27 +196,24 @@ def decode_price_table(frame):
     }
 
 
-def bcd_to_number(bytes_list):
-    s = ""
-    for b in bytes_list:
-        s += f"{b:02X}"
-    return int(s)
-
-
 def decode_bcd_3byte(b1, b2, b3):
-    """Decode 3-byte BCD to decimal number"""
-    digits = []
-    for byte in [b1, b2, b3]:
-        hi = (byte >> 4) & 0xF
-        lo = byte & 0xF
-        if hi > 9 or lo > 9:
-            # Invalid BCD, return 0
-            return 0
-        digits.append(str(hi))
-        digits.append(str(lo))
-    num_str = "".join(digits)
+    """Decode 3-byte BCD to decimal number
+
+    All three bytes are packed into one integer and processed together:
+    the high and low nibbles of every byte are split with one mask each,
+    then combined as hi * 10 + lo per byte (at most 99, so bytes never carry
+    into each other).
+    """
+    x = (b1 << 16) | (b2 << 8) | b3
+    hi = (x >> 4) & 0x0F0F0F
+    lo = x & 0x0F0F0F
+    # A nibble above 9 overflows into bit 4 of its byte when 6 is added
+    if ((hi + 0x060606) | (lo + 0x060606)) & 0xF0F0F0:
+        # Invalid BCD, return 0
+        return 0
+    d = hi * 10 + lo
     # Return raw integer value (don't divide by 100 here)
-    return int(num_str)
+    return (d >> 16) * 10000 + ((d >> 8) & 0xFF) * 100 + (d & 0xFF)
 
 
 def is_fueling(frame):
@@ -111,12 +222,11 @@ def is_fueling(frame):
     if len(frame) != 16:
         return False
     # Check for DELIVERY_SUMMARY (0x38) or other commands with mode 0x02
-    if frame[2] == 0x02 and frame[3] == 0x08 and frame[4:6] == [0x00, 0x00] and frame[-2:] == [0x03, 0xFA]:
-        return True
-    return False
+    return frame[2:6] == _FUELING_SIG and frame[-2:] == FRAME_END
 
 
-def decode_fueling(frame):
+def decode_fueling(frame, with_hex=True):
+    """Decode a fueling frame; with_hex=False skips the *_hex fields."""
     pump = frame[0]
     cmd = frame[1]
     
@@ -130,26 +240,25 @@ def decode_fueling(frame):
     money_raw = decode_bcd_3byte(frame[9], frame[10], frame[11])
     liters_raw = decode_bcd_3byte(frame[6], frame[7], frame[8])
     
-    # Extract hex bytes for liters and money
-    liters_hex = " ".join(f"{frame[i]:02X}" for i in [6, 7, 8])
-    money_hex = " ".join(f"{frame[i]:02X}" for i in [9, 10, 11])
-    
     # Apply correct scaling factors (validated from 43 fueling frames)
     # Mean Absolute Error: 0.000272 SAR, Max Error: 0.000460 SAR
     liters = liters_raw / LITERS_DIVISOR
     money_sar = money_raw / MONEY_DIVISOR
     
-    return {
+    decoded = {
         "type": "fueling",
         "pump": pump,
         "command": hex(cmd),
         "money_sar": round(money_sar, 2),
         "liters": round(liters, 2),
         "unit_price": UNIT_PRICE,
-        "frame_hex": " ".join(f"{x:02X}" for x in frame),
-        "liters_hex": liters_hex,
-        "money_hex": money_hex
     }
+    if with_hex:
+        # Extract hex bytes for liters and money
+        decoded["frame_hex"] = frame.hex(" ").upper()
+        decoded["liters_hex"] = frame[6:9].hex(" ").upper()
+        decoded["money_hex"] = frame[9:12].hex(" ").upper()
+    return decoded
 
 
 def is_single_price(frame):
@@ -157,11 +266,9 @@ def is_single_price(frame):
     if len(frame) != 15:
         return False
     # Check for pattern: 01 01 XX 03 04 00 21 80
-    return (frame[2:4] == [0x01, 0x01] and
-            frame[4] in [0x01, 0x02, 0x04, 0x05] and
-            frame[5:9] == [0x03, 0x04, 0x00, 0x21] and
-            frame[9] == 0x80 and
-            frame[-2:] == [0x03, 0xFA])
+    return (_read_u64(frame, 2)[0] & _SINGLE_PRICE_MASK == _SINGLE_PRICE_SIG and
+            frame[4] in (0x01, 0x02, 0x04, 0x05) and
+            frame[-2:] == FRAME_END)
 
 
 def decode_single_price(frame):
@@ -188,7 +295,7 @@ def decode_single_price(frame):
         "command": hex(cmd),
         "price_type": hex(price_type),
         "price_sar_per_liter": round(price, 4),
-        "frame_hex": " ".join(f"{x:02X}" for x in frame)
+        "frame_hex": frame.hex(" ").upper()
     }
 
 
@@ -196,7 +303,7 @@ def is_status_frame(frame):
     """9-byte frames with pattern: PP CC 01 01 XX CRC 03 FA"""
     if len(frame) != 9:
         return False
-    return (frame[2:4] == [0x01, 0x01] and frame[-2:] == [0x03, 0xFA])
+    return frame[2:4] == _DATA_ITEM_SIG and frame[-2:] == FRAME_END
 
 
 def decode_status_frame(frame):
@@ -216,9 +323,9 @@ def decode_status_frame(frame):
 
 def is_extended_data(frame):
     """Frames with pattern: PP CC 65 XX ... CRC 03 FA (9 or 14 bytes)"""
-    if len(frame) not in [9, 14]:
+    if len(frame) not in (9, 14):
         return False
-    return frame[2] == 0x65 and frame[-2:] == [0x03, 0xFA]
+    return frame[2] == 0x65 and frame[-2:] == FRAME_END
 
 
 def decode_extended_data(frame):
@@ -236,7 +343,7 @@ def decode_extended_data(frame):
         "command": hex(cmd),
         "extended_type": hex(ext_type),
         "data_length": len(data_bytes),
-        "data_hex": " ".join(f"{b:02X}" for b in data_bytes)
+        "data_hex": data_bytes.hex(" ").upper()
     }
 
 
@@ -244,8 +351,7 @@ def is_config_frame(frame):
     """12-byte frames with pattern: PP CC 03 04 00 21 80 ... CRC 03 FA"""
     if len(frame) != 12:
         return False
-    return (frame[2:7] == [0x03, 0x04, 0x00, 0x21, 0x80] and
-            frame[-2:] == [0x03, 0xFA])
+    return frame[2:7] == _CONFIG_SIG and frame[-2:] == FRAME_END
 
 
 def decode_config_frame(frame):
@@ -258,7 +364,7 @@ def decode_config_frame(frame):
         "type": "config",
         "pump": pump,
         "command": hex(cmd),
-        "config_data": " ".join(f"{b:02X}" for b in config_bytes)
+        "config_data": config_bytes.hex(" ").upper()
     }
 
 
@@ -266,7 +372,7 @@ def is_multi_data_frame(frame):
     """Frames with 02 04 pattern (multiple data items)"""
     if len(frame) != 12:
         return False
-    return frame[2:4] == [0x02, 0x04] and frame[-2:] == [0x03, 0xFA]
+    return frame[2:4] == _MULTI_DATA_SIG and frame[-2:] == FRAME_END
 
 
 def decode_multi_data_frame(frame):
@@ -280,7 +386,7 @@ def decode_multi_data_frame(frame):
         "pump": pump,
         "command": hex(cmd),
         "data_items": [hex(b) for b in data_bytes],
-        "data_hex": " ".join(f"{b:02X}" for b in data_bytes)
+        "data_hex": data_bytes.hex(" ").upper()
     }
 
 
@@ -288,9 +394,7 @@ def is_special_data_frame(frame):
     """20-byte frames with pattern: PP CC 05 0C 00 21 80 ..."""
     if len(frame) != 20:
         return False
-    return (frame[2:6] == [0x05, 0x0C, 0x00, 0x21] and
-            frame[6] == 0x80 and
-            frame[-2:] == [0x03, 0xFA])
+    return frame[2:7] == _SPECIAL_DATA_SIG and frame[-2:] == FRAME_END
 
 
 def decode_special_data_frame(frame):
@@ -312,14 +416,14 @@ def decode_special_data_frame(frame):
             "pump": pump,
             "command": hex(cmd),
             "values": [round(v, 4) for v in values],
-            "data_hex": " ".join(f"{b:02X}" for b in data_bytes)
+            "data_hex": data_bytes.hex(" ").upper()
         }
     
     return {
         "type": "special_data",
         "pump": pump,
         "command": hex(cmd),
-        "data_hex": " ".join(f"{b:02X}" for b in data_bytes)
+        "data_hex": data_bytes.hex(" ").upper()
     }
 
 
@@ -328,73 +432,89 @@ def is_fueling_with_extra(frame):
     if len(frame) != 22:
         return False
     # Check if it starts like a fueling frame
-    return (frame[2:6] == [0x02, 0x08, 0x00, 0x00] and
-            frame[-2:] == [0x03, 0xFA])
+    return frame[2:6] == _FUELING_SIG and frame[-2:] == FRAME_END
 
 
-def decode_fueling_with_extra(frame):
-    """Decode fueling frame with extra appended data"""
-    pump = frame[0]
-    cmd = frame[1]
-    
-    # First part is a normal fueling frame (bytes 0-15)
-    fueling_part = frame[:16]
-    if is_fueling(fueling_part):
-        fueling_data = decode_fueling(fueling_part)
-        # Extra data is bytes 16-19
-        extra_data = frame[16:20]
-        fueling_data["type"] = "fueling_with_extra"
-        fueling_data["extra_data"] = " ".join(f"{b:02X}" for b in extra_data)
-        fueling_data["frame_hex"] = " ".join(f"{x:02X}" for x in frame)
-        # Keep liters_hex and money_hex from the decoded fueling part
-        return fueling_data
-    
-    return {
-        "type": "fueling_with_extra",
-        "pump": pump,
-        "command": hex(cmd),
-        "raw_hex": " ".join(f"{x:02X}" for x in frame)
+def decode_fueling_with_extra(frame, with_hex=True):
+    """Decode fueling frame with extra appended data
+
+    Callers have already matched is_fueling_with_extra, whose header is the
+    fueling header, so bytes 0-11 decode exactly like a fueling frame.
+    """
+    fueling_data = decode_fueling(frame, with_hex)
+    fueling_data["type"] = "fueling_with_extra"
+    # Extra data is bytes 16-19
+    fueling_data["extra_data"] = frame[16:20].hex(" ").upper()
+    # frame_hex, liters_hex and money_hex already cover the whole frame
+    return fueling_data
+
+
+def _decode_single_price_or_unknown(frame):
+    price_decoded = decode_single_price(frame)
+    if price_decoded is not None:
+        return price_decoded
+    # Frame matched pattern but price was invalid - treat as unknown
+    return {"type": "unknown", "raw": frame.hex(" ").upper(), "note": "Matched price pattern but decoded value invalid"}
+
+
+def _build_dispatch(with_hex):
+    """Map (length, byte 2, byte 3) to the only frame type that can match.
+
+    Every predicate fixes the frame length and byte 2 (and all but
+    is_extended_data fix byte 3), and no two predicates share a key, so a
+    single lookup replaces the cascade of is_* checks.
+    """
+    table = {
+        (17, 0x01, 0x01): (is_price_table, decode_price_table),
+        (22, 0x02, 0x08): (is_fueling_with_extra,
+                           functools.partial(decode_fueling_with_extra, with_hex=with_hex)),
+        (16, 0x02, 0x08): (is_fueling, functools.partial(decode_fueling, with_hex=with_hex)),
+        (15, 0x01, 0x01): (is_single_price, _decode_single_price_or_unknown),
+        (9, 0x01, 0x01): (is_status_frame, decode_status_frame),
+        (12, 0x03, 0x04): (is_config_frame, decode_config_frame),
+        (20, 0x05, 0x0C): (is_special_data_frame, decode_special_data_frame),
+        (12, 0x02, 0x04): (is_multi_data_frame, decode_multi_data_frame),
     }
+    # Extended data frames accept any byte 3
+    for length in (9, 14):
+        for b3 in range(256):
+            table[(length, 0x65, b3)] = (is_extended_data, decode_extended_data)
+    return table
+
 
+# Keyed by with_hex
+_DISPATCH = {True: _build_dispatch(True), False: _build_dispatch(False)}
 
-def decode_dump(raw):
-    byte_stream = clean_dump(raw)
-    frames = extract_frames(byte_stream)
 
+def _classify_and_decode(frames, with_hex=True):
+    """Classify and decode every frame in one pass.
+
+    The lookups used on every frame are bound to locals up front so the loop
+    body does no global or attribute lookups.
+    """
     decoded = []
+    append = decoded.append
+    heartbeat = is_heartbeat
+    lookup = _DISPATCH[with_hex].get
 
     for f in frames:
-        if is_heartbeat(f):
+        if heartbeat(f):
             continue
-        elif is_price_table(f):
-            decoded.append(decode_price_table(f))
-        elif is_fueling_with_extra(f):
-            decoded.append(decode_fueling_with_extra(f))
-        elif is_fueling(f):
-            decoded.append(decode_fueling(f))
-        elif is_single_price(f):
-            price_decoded = decode_single_price(f)
-            if price_decoded is not None:
-                decoded.append(price_decoded)
-            else:
-                # Frame matched pattern but price was invalid - treat as unknown
-                decoded.append({"type": "unknown", "raw": " ".join(f"{x:02X}" for x in f), "note": "Matched price pattern but decoded value invalid"})
-        elif is_status_frame(f):
-            decoded.append(decode_status_frame(f))
-        elif is_extended_data(f):
-            decoded.append(decode_extended_data(f))
-        elif is_config_frame(f):
-            decoded.append(decode_config_frame(f))
-        elif is_special_data_frame(f):
-            decoded.append(decode_special_data_frame(f))
-        elif is_multi_data_frame(f):
-            decoded.append(decode_multi_data_frame(f))
+        # Heartbeat check guarantees len(f) >= 6
+        entry = lookup((len(f), f[2], f[3]))
+        if entry is not None and entry[0](f):
+            append(entry[1](f))
         else:
-            decoded.append({"type": "unknown", "raw": " ".join(f"{x:02X}" for x in f)})
+            append({"type": "unknown", "raw": f.hex(" ").upper()})
 
     return decoded
 
 
+def decode_dump(raw, with_hex=True):
+    """Decode a text dump; with_hex=False skips the fueling *_hex fields."""
+    return _classify_and_decode(extract_frames(clean_dump(raw)), with_hex)
+
+
 # Generate structured JSON fueling report
 def generate_fueling_json_report(decoded_data):
     """Generate a structured JSON report with fueling data"""
@@ -408,22 +528,19 @@ def generate_fueling_json_report(decoded_data):
             "fueling_updates": []
         }
     
-    prev_liters = 0
-    prev_money = 0
+    # Work column by column: increments are a pairwise difference against
+    # the previous update (the first update is measured from zero)
+    all_liters = [frame.get("liters", 0) for frame in fueling_frames]
+    all_money = [frame.get("money_sar", 0) for frame in fueling_frames]
+    liters_incs = map(operator.sub, all_liters, [0] + all_liters)
+    money_incs = map(operator.sub, all_money, [0] + all_money)
     
     updates = []
-    for i, frame in enumerate(fueling_frames, 1):
-        pump = frame.get("pump", 0)
-        money = frame.get("money_sar", 0)
-        liters = frame.get("liters", 0)
-        
-        # Calculate increments
-        liters_inc = liters - prev_liters
-        money_inc = money - prev_money
-        
+    rows = zip(fueling_frames, all_liters, liters_incs, all_money, money_incs)
+    for i, (frame, liters, liters_inc, money, money_inc) in enumerate(rows, 1):
         updates.append({
             "update_number": i,
-            "pump": f"0x{pump:02X}",
+            "pump": f"0x{frame.get('pump', 0):02X}",
             "liters": round(liters, 2),
             "liters_increment": round(liters_inc, 2),
             "money_sar": round(money, 2),
@@ -433,9 +550,6 @@ def generate_fueling_json_report(decoded_data):
             "liters_hex": frame.get("liters_hex", ""),
             "money_hex": frame.get("money_hex", "")
         })
-        
-        prev_liters = liters
-        prev_money = money
     
     final = fueling_frames[-1] if fueling_frames else {}
     
@@ -493,6 +607,13 @@ def print_fueling_report(decoded_data):
         print("=" * 60)
 
 
+def _dumps(obj):
+    """Encode obj as JSON bytes indented by 2 spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
 # Example usage:
 if __name__ == "__main__":
     import sys
@@ -516,10 +637,13 @@ if __name__ == "__main__":
         "all_frames": out
     }
 
+    # Encode once and reuse the result for both outputs
+    encoded = _dumps(json_output)
+
     # Save JSON output to file
     output_filename = filename.replace(".txt", "_decoded.json")
-    with open(output_filename, "w") as f:
-        json.dump(json_output, f, indent=2)
+    with open(output_filename, "wb") as f:
+        f.write(encoded)
 
     # Output JSON to console
-    print(json.dumps(json_output, indent=2))
\ No newline at end of file
+    print(encoded.decode())
\ No newline at end of file
@@ -1,3 +1,4 @@
+import argparse
 import time
 import sys
 from datetime import datetime
@@ -9,7 +10,7 @@ try:
 except ImportError:
     SERIAL_AVAILABLE = False
 from mepsan_decoder import (
-    extract_frames,
+    FrameScanner,
     is_heartbeat,
     is_price_table,
     is_fueling,
@@ -34,9 +35,17 @@ from mepsan_decoder import (
 PORT = "/dev/ttyUSB0"
 BAUD = 9600
 
+parser = argparse.ArgumentParser(description="Fuel pump protocol decoder")
+parser.add_argument("--simulate", nargs="?", const="logs_after.txt", metavar="FILE",
+                    help="replay a captured log instead of reading the serial port")
+parser.add_argument("--realtime", action="store_true",
+                    help="in simulation mode, replay line by line with a 0.1 s delay")
+args = parser.parse_args()
+
 # Check for simulation mode
-SIMULATION_MODE = len(sys.argv) > 1 and sys.argv[1] == "--simulate"
-SIMULATION_FILE = sys.argv[2] if len(sys.argv) > 2 else "logs_after.txt"
+SIMULATION_MODE = args.simulate is not None
+SIMULATION_FILE = args.simulate
+REALTIME = args.realtime
 
 if SIMULATION_MODE:
     print(f"\n{'='*80}")
@@ -66,8 +75,8 @@ else:
         sys.exit(1)
     print("✓ Connected successfully. Listening for pump data...\n")
 
-# Buffer for incomplete frames
-byte_buffer = []
+# Keeps incomplete frames between reads
+scanner = FrameScanner()
 
 # Track fueling session for better display
 fueling_sessions = {}  # pump -> last values
@@ -82,7 +91,7 @@ def decode_and_display_frame(frame):
     try:
         # Only display fueling operations - skip all other frame types
         if is_fueling_with_extra(frame):
-            decoded = decode_fueling_with_extra(frame)
+            decoded = decode_fueling_with_extra(frame, with_hex=False)
             pump_num = decoded['pump'] & 0x0F
             liters = decoded['liters']
             money = decoded['money_sar']
@@ -106,7 +115,7 @@ def decode_and_display_frame(frame):
             fueling_sessions[pump_key] = (liters, money)
             
         elif is_fueling(frame):
-            decoded = decode_fueling(frame)
+            decoded = decode_fueling(frame, with_hex=False)
             pump_num = decoded['pump'] & 0x0F
             liters = decoded['liters']
             money = decoded['money_sar']
@@ -136,49 +145,32 @@ def decode_and_display_frame(frame):
     except Exception as e:
         print(f"\n[{timestamp}] ⚠️  Decode Error: {e}")
 
+def _process_chunk(scanner, data):
+    """Feed newly received bytes to the scanner and display every completed frame"""
+    for frame in scanner.feed(data):
+        decode_and_display_frame(frame)
+
 if SIMULATION_MODE:
     # Simulation mode: read from file
     try:
         with open(SIMULATION_FILE, 'r') as f:
             lines = f.readlines()
         
-        for line_num, line in enumerate(lines, 1):
-            if "DATA:" in line:
-                # Extract hex bytes from the line
-                hex_part = line.split("DATA:")[1].strip()
-                hex_bytes = hex_part.split()
-                
-                # Convert to bytes
-                data = bytes([int(x, 16) for x in hex_bytes])
-                
-                if data:
-                    # Add new bytes to buffer
-                    byte_buffer.extend(data)
-                    
-                    # Extract complete frames
-                    frames = extract_frames(byte_buffer)
-                    
-                    # Process each complete frame
-                    for frame in frames:
-                        decode_and_display_frame(frame)
+        if REALTIME:
+            for line_num, line in enumerate(lines, 1):
+                if "DATA:" in line:
+                    # Convert the hex bytes after the marker
+                    data = bytes.fromhex(line.split("DATA:")[1])
                     
-                    # Keep only incomplete frame data in buffer
-                    # Find the last complete frame end (0x03, 0xFA)
-                    last_frame_end = -1
-                    for i in range(len(byte_buffer) - 1, 0, -1):
-                        if byte_buffer[i-1:i+1] == [0x03, 0xFA]:
-                            last_frame_end = i + 1
-                            break
-                    
-                    if last_frame_end > 0:
-                        # Keep only bytes after the last complete frame
-                        byte_buffer = byte_buffer[last_frame_end:]
-                    elif len(byte_buffer) > 1000:
-                        # Prevent buffer overflow - keep last 500 bytes if no frame found
-                        byte_buffer = byte_buffer[-500:]
-                    
-                    # Small delay to simulate real-time processing
-                    time.sleep(0.1)
+                    if data:
+                        _process_chunk(scanner, data)
+                        
+                        # Small delay to simulate real-time processing
+                        time.sleep(0.1)
+        else:
+            # Feed the whole capture at once, as fast as it decodes
+            data = bytes.fromhex(" ".join(line.split("DATA:")[1] for line in lines if "DATA:" in line))
+            _process_chunk(scanner, data)
         
         print("\n" + "=" * 80)
         print("  Simulation Complete")
@@ -198,31 +190,7 @@ else:
         try:
             data = ser.read(256)
             if data:
-                # Add new bytes to buffer
-                byte_buffer.extend(data)
-                
-                # Extract complete frames
-                frames = extract_frames(byte_buffer)
-                
-                # Process each complete frame
-                for frame in frames:
-                    decode_and_display_frame(frame)
-                
-                # Keep only incomplete frame data in buffer
-                # Find the last complete frame end (0x03, 0xFA)
-                last_frame_end = -1
-                for i in range(len(byte_buffer) - 1, 0, -1):
-                    if byte_buffer[i-1:i+1] == [0x03, 0xFA]:
-                        last_frame_end = i + 1
-                        break
-                
-                if last_frame_end > 0:
-                    # Keep only bytes after the last complete frame
-                    byte_buffer = byte_buffer[last_frame_end:]
-                elif len(byte_buffer) > 1000:
-                    # Prevent buffer overflow - keep last 500 bytes if no frame found
-                    byte_buffer = byte_buffer[-500:]
-                    
+                _process_chunk(scanner, data)
         except KeyboardInterrupt:
             print("\n\nStopped by user.")
             break